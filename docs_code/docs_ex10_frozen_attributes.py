@@ -74,6 +74,10 @@ def delattr_generator(cls, funcname="__delattr__"):
 frozen_setattr_field_maker = dtbuild.MethodMaker("__setattr__", setattr_generator)
 frozen_delattr_field_maker = dtbuild.MethodMaker("__delattr__", delattr_generator)
 gatherer = dtbuild.make_unified_gatherer(FreezableField)
+frozen_methods = dtbuild.default_methods | {
+    dtbuild.frozen_setattr_maker,
+    dtbuild.frozen_delattr_maker,
+}
 
 
 def freezable(cls=None, /, *, frozen=False):
@@ -86,16 +90,13 @@ def freezable(cls=None, /, *, frozen=False):
     cls = dtbuild.builder(
         cls,
         gatherer=gatherer,
-        methods=dtbuild.default_methods,
+        methods=frozen_methods if frozen else dtbuild.default_methods,
         flags=flags,
     )
 
-    # Frozen attributes need to be added afterwards
+    # Frozen attribute methods need to be added afterwards
     # Due to the need to know if frozen fields exist
-    if frozen:
-        setattr(cls, "__setattr__", dtbuild.frozen_setattr_maker)
-        setattr(cls, "__delattr__", dtbuild.frozen_delattr_maker)
-    else:
+    if not frozen:
         fields = dtbuild.get_fields(cls)
         has_frozen_fields = False
         for f in fields.values():
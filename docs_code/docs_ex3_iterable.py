@@ -9,8 +9,8 @@ from ducktools.classbuilder import (
 
 
 def iter_generator(cls, funcname="__iter__"):
-    field_names = get_fields(cls).keys()
-    field_yield = "\n".join(f"    yield self.{f}" for f in field_names)
+    fields = get_fields(cls)
+    field_yield = "\n".join(f"    yield self.{f}" for f in fields)
     if not field_yield:
         field_yield = "    yield from ()"
     code = f"def {funcname}(self):\n{field_yield}"
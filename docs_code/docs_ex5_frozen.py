@@ -11,7 +11,8 @@ new_methods = default_methods | {frozen_setattr_maker, frozen_delattr_maker}
 
 
 def frozen(cls, /):
-    return slotclass(cls, methods=new_methods)
+    # The "frozen" flag lets __init__ skip the frozen __setattr__
+    return slotclass(cls, methods=new_methods, flags={"frozen": True})
 
 
 if __name__ == "__main__":
@@ -16,22 +16,27 @@ class ConverterField(Field):
 
 def setattr_generator(cls, funcname="__setattr__"):
     fields = get_fields(cls)
-    converters = {}
-    for k, v in fields.items():
-        if conv := getattr(v, "converter", None):
-            converters[k] = conv
 
     globs = {
-        "_converters": converters,
         "_object_setattr": object.__setattr__,
     }
 
+    # Compare the name against each converted field directly
+    # Fields without converters fall through to the plain setattr
+    branches = []
+    for k, v in fields.items():
+        if conv := getattr(v, "converter", None):
+            globs[f"_{k}_converter"] = conv
+            branches.append(
+                f"    if name == {k!r}:\n"
+                f"        _object_setattr(self, name, _{k}_converter(value))\n"
+                f"        return\n"
+            )
+
     code = (
         f"def {funcname}(self, name, value):\n"
-        f"    if conv := _converters.get(name):\n"
-        f"        _object_setattr(self, name, conv(value))\n"
-        f"    else:\n"
-        f"        _object_setattr(self, name, value)\n"
+        f"{''.join(branches)}"
+        f"    _object_setattr(self, name, value)\n"
     )
 
     return GeneratedCode(code, globs)
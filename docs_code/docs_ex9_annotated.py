@@ -67,11 +67,18 @@ def annotated_gatherer(cls_or_ns):
         modifiers = {}
 
         if get_origin(anno) is Annotated:
-            meta = anno.__metadata__
-            for v in meta:
-                if isinstance(v, FieldModifier):
-                    # Merge the modifier arguments to pass to AnnoField
-                    modifiers.update(v.modifiers)
+            field_modifiers = [
+                v.modifiers for v in anno.__metadata__
+                if isinstance(v, FieldModifier)
+            ]
+            if len(field_modifiers) == 1:
+                # Only used as keyword arguments so a single modifier
+                # dict can be used without copying
+                modifiers = field_modifiers[0]
+            else:
+                # Merge the modifier arguments to pass to AnnoField
+                for mods in field_modifiers:
+                    modifiers.update(mods)
 
             # Extract the actual annotation from the first argument
             anno = anno.__origin__
@@ -31,8 +31,9 @@
 # Field itself sidesteps this by defining __slots__ to avoid that branch.
 
 import os
+import _thread
 
-from .annotations import get_ns_annotations, is_classvar
+from .annotations import get_ns_annotations, is_classvar, _compile_cached
 from ._version import __version__, __version_tuple__
 
 # Change this name if you make heavy modifications
@@ -99,6 +100,8 @@ def _get_inst_fields(inst):
 # As 'None' can be a meaningful value we need a sentinel value
 # to use to show no value has been provided.
 class _NothingType:
+    __slots__ = ()
+
     def __repr__(self):
         return "<NOTHING OBJECT>"
 
@@ -110,6 +113,8 @@ NOTHING = _NothingType()
 # keyword only
 # noinspection PyPep8Naming
 class _KW_ONLY_TYPE:
+    __slots__ = ()
+
     def __repr__(self):
         return "<KW_ONLY Sentinel Object>"
 
@@ -153,13 +158,12 @@ class MethodMaker:
         """
         self.funcname = funcname
         self.code_generator = code_generator
+        self._lock = _thread.RLock()
 
     def __repr__(self):
         return f"<MethodMaker for {self.funcname!r} method>"
 
     def __get__(self, inst, cls):
-        local_vars = {}
-
         # This can be called via super().funcname(...) in which case the class
         # may not be the correct one. If this is the correct class
         # it should have this descriptor in the class dict under
@@ -179,19 +183,25 @@ class MethodMaker:
                     f"Could not find {self!r} in class {cls.__name__!r} MRO."
                 )
 
-        gen = self.code_generator(gen_cls, self.funcname)
-        exec(gen.source_code, gen.globs, local_vars)
-        method = local_vars.get(self.funcname)
-
-        try:
-            method.__qualname__ = f"{gen_cls.__qualname__}.{self.funcname}"
-        except AttributeError:
-            # This might be a property or some other special
-            # descriptor. Don't try to rename.
-            pass
-
-        # Replace this descriptor on the class with the generated function
-        setattr(gen_cls, self.funcname, method)
+        with self._lock:
+            # Another thread may have generated the method while this one
+            # was waiting, in which case use that method instead.
+            method = gen_cls.__dict__.get(self.funcname)
+            if method is self:
+                local_vars = {}
+                gen = self.code_generator(gen_cls, self.funcname)
+                exec(_compile_cached(gen.source_code, "exec"), gen.globs, local_vars)
+                method = local_vars.get(self.funcname)
+
+                try:
+                    method.__qualname__ = f"{gen_cls.__qualname__}.{self.funcname}"
+                except AttributeError:
+                    # This might be a property or some other special
+                    # descriptor. Don't try to rename.
+                    pass
+
+                # Replace this descriptor on the class with the generated function
+                setattr(gen_cls, self.funcname, method)
 
         # Use 'get' to return the generated function as a bound method
         # instead of as a regular function for first usage.
@@ -222,10 +232,28 @@ class _SignatureMaker:
 signature_maker = _SignatureMaker()
 
 
+# Types whose repr can be placed directly in generated source
+# Exact types only, subclasses (eg: IntEnum) may not have a literal repr
+_LITERAL_TYPES = {str, int, bool, bytes, type(None)}
+
+
+def _is_literal(value):
+    value_type = type(value)
+    if value_type in _LITERAL_TYPES:
+        return True
+    elif value_type is float:
+        # 'inf' and 'nan' are not valid literals
+        return value - value == 0.0
+    elif value_type is tuple:
+        return all(_is_literal(item) for item in value)
+    return False
+
+
 def get_init_generator(null=NOTHING, extra_code=None):
     def cls_init_maker(cls, funcname="__init__"):
-        fields = get_fields(cls)
-        flags = get_flags(cls)
+        internals = getattr(cls, INTERNALS_DICT)
+        fields = internals["fields"]
+        flags = internals["flags"]
 
         arglist = []
         kw_only_arglist = []
@@ -234,35 +262,49 @@ def get_init_generator(null=NOTHING, extra_code=None):
 
         kw_only_flag = flags.get("kw_only", False)
 
+        # Frozen classes only need the `__setattr__` check after `__init__`
+        # so set the initial values directly with object.__setattr__
+        if flags.get("frozen", False):
+            globs["__setattr_func"] = object.__setattr__
+            assignment_template = "__setattr_func(self, {name!r}, {value})"
+        else:
+            assignment_template = "self.{name} = {value}"
+
         for k, v in fields.items():
             if v.init:
                 if v.default is not null:
                     globs[f"_{k}_default"] = v.default
                     arg = f"{k}=_{k}_default"
-                    assignment = f"self.{k} = {k}"
+                    value = k
                 elif v.default_factory is not null:
                     globs[f"_{k}_factory"] = v.default_factory
                     arg = f"{k}=None"
-                    assignment = f"self.{k} = _{k}_factory() if {k} is None else {k}"
+                    value = f"_{k}_factory() if {k} is None else {k}"
                 else:
                     arg = f"{k}"
-                    assignment = f"self.{k} = {k}"
+                    value = k
 
                 if kw_only_flag or v.kw_only:
                     kw_only_arglist.append(arg)
                 else:
                     arglist.append(arg)
 
-                assignments.append(assignment)
-            else:
-                if v.default is not null:
+            elif v.default is not null:
+                # Arguments only evaluate defaults when the function is defined
+                # but these are evaluated on every call, so use a constant
+                # where possible
+                if _is_literal(v.default):
+                    value = repr(v.default)
+                else:
                     globs[f"_{k}_default"] = v.default
-                    assignment = f"self.{k} = _{k}_default"
-                    assignments.append(assignment)
-                elif v.default_factory is not null:
-                    globs[f"_{k}_factory"] = v.default_factory
-                    assignment = f"self.{k} = _{k}_factory()"
-                    assignments.append(assignment)
+                    value = f"_{k}_default"
+            elif v.default_factory is not null:
+                globs[f"_{k}_factory"] = v.default_factory
+                value = f"_{k}_factory()"
+            else:
+                continue
+
+            assignments.append(assignment_template.format(name=k, value=value))
 
         pos_args = ", ".join(arglist)
         kw_args = ", ".join(kw_only_arglist)
@@ -281,8 +323,7 @@ def get_init_generator(null=NOTHING, extra_code=None):
         # Handle additional function calls
         # Used for validate_field on fieldclasses
         if extra_code:
-            for line in extra_code:
-                code += f"    {line}\n"
+            code += "".join(f"    {line}\n" for line in extra_code)
 
         return GeneratedCode(code, globs)
 
@@ -301,7 +342,12 @@ def get_repr_generator(recursion_safe=False, eval_safe=False):
                       not evaluate.
     :return:
     """
+    # The recursive_repr decorator keeps its state per decorated function
+    # so a single decorator can be shared by every generated __repr__
+    recursive_repr_decorator = None
+
     def cls_repr_generator(cls, funcname="__repr__"):
+        nonlocal recursive_repr_decorator
         fields = get_fields(cls)
 
         globs = {}
@@ -321,8 +367,10 @@ def get_repr_generator(recursion_safe=False, eval_safe=False):
         )
 
         if recursion_safe:
-            import reprlib
-            globs["_recursive_repr"] = reprlib.recursive_repr()
+            if recursive_repr_decorator is None:
+                import reprlib
+                recursive_repr_decorator = reprlib.recursive_repr()
+            globs["_recursive_repr"] = recursive_repr_decorator
             recursion_func = "@_recursive_repr\n"
         else:
             recursion_func = ""
@@ -362,6 +410,8 @@ def eq_generator(cls, funcname="__eq__"):
         if attrib.compare
     ]
 
+    # Comparing attributes directly is faster than building tuples
+    # to compare (including with operator.attrgetter) and can exit early
     if field_names:
         instance_comparison = "\n        and ".join(
             f"self.{name} == other.{name}" for name in field_names
@@ -382,8 +432,9 @@ def eq_generator(cls, funcname="__eq__"):
 
 def frozen_setattr_generator(cls, funcname="__setattr__"):
     globs = {}
-    field_names = set(get_fields(cls))
-    flags = get_flags(cls)
+    internals = getattr(cls, INTERNALS_DICT)
+    field_names = frozenset(internals["fields"])
+    flags = internals["flags"]
 
     globs["__field_names"] = field_names
 
@@ -398,7 +449,7 @@ def frozen_setattr_generator(cls, funcname="__setattr__"):
         hasattr_check = "name in self.__dict__"
 
     body = (
-        f"    if {hasattr_check} or name not in __field_names:\n"
+        f"    if name not in __field_names or {hasattr_check}:\n"
         f'        raise TypeError(\n'
         f'            f"{{type(self).__name__!r}} object does not support "'
         f'            f"attribute assignment"\n'
@@ -453,6 +504,9 @@ def builder(cls=None, /, *, gatherer, methods, flags=None, fix_signature=True):
     :type methods: set[MethodMaker]
     :param flags: additional flags to store in the internals dictionary
                   for use by method generators.
+                  The included generators use "slotted" to indicate the class
+                  uses __slots__ and "frozen" to make __init__ set values with
+                  object.__setattr__ so it is not blocked by a frozen __setattr__.
     :type flags: None | dict[str, bool]
     :param fix_signature: Add a __signature__ attribute to work-around an issue with
                           inspect.signature incorrectly handling __init__ descriptors.
@@ -482,15 +536,21 @@ def builder(cls=None, /, *, gatherer, methods, flags=None, fix_signature=True):
     internals["local_fields"] = cls_fields
 
     mro = cls.__mro__[:-1]  # skip 'object' base class
+    bases = cls.__bases__
     if mro == (cls,):  # special case of no inheritance.
         fields = cls_fields.copy()
+    elif len(bases) == 1 and INTERNALS_DICT in bases[0].__dict__:
+        # Single inheritance from a built class, the parent's fields
+        # already include everything further up the MRO
+        fields = {**bases[0].__dict__[INTERNALS_DICT]["fields"], **cls_fields}
     else:
         fields = {}
         for c in reversed(mro):
-            try:
-                fields.update(get_fields(c, local=True))
-            except AttributeError:
-                pass
+            # Only use internals defined on each class itself, classes
+            # that were not built would otherwise repeat their parent's fields
+            c_internals = c.__dict__.get(INTERNALS_DICT)
+            if c_internals is not None:
+                fields.update(c_internals["local_fields"])
 
     internals["fields"] = fields
     internals["flags"] = flags if flags is not None else {}
@@ -524,6 +584,8 @@ class SlotFields(dict):
 
     This should be replaced on `__slots__` after fields have been gathered.
     """
+    __slots__ = ()
+
     def __repr__(self):
         return f"SlotFields({super().__repr__()})"
 
@@ -636,15 +698,17 @@ class Field(metaclass=SlotMakerMeta):
         self.validate_field()
 
     def __init_subclass__(cls, frozen=False):
+        frozen = frozen or _UNDER_TESTING
+
         field_methods = {_field_init_maker, repr_maker, eq_maker}
-        if frozen or _UNDER_TESTING:
+        if frozen:
             field_methods.update({frozen_setattr_maker, frozen_delattr_maker})
 
         builder(
             cls,
             gatherer=unified_gatherer,
             methods=field_methods,
-            flags={"slotted": True, "kw_only": True}
+            flags={"slotted": True, "kw_only": True, "frozen": frozen}
         )
 
     def validate_field(self):
@@ -928,20 +992,26 @@ def check_argument_order(cls):
 
 
 # Class Decorators
-def slotclass(cls=None, /, *, methods=default_methods, syntax_check=True):
+def slotclass(cls=None, /, *, methods=default_methods, flags=None, syntax_check=True):
     """
     Example of class builder in action using __slots__ to find fields.
 
     :param cls: Class to be analysed and modified
     :param methods: MethodMakers to be added to the class
+    :param flags: additional flags to pass to the builder,
+                  "slotted" is always set to True.
     :param syntax_check: check there are no arguments without defaults
                         after arguments with defaults.
     :return: Modified class
     """
     if not cls:
-        return lambda cls_: slotclass(cls_, methods=methods, syntax_check=syntax_check)
+        return lambda cls_: slotclass(
+            cls_, methods=methods, flags=flags, syntax_check=syntax_check
+        )
+
+    flags = {**flags, "slotted": True} if flags else {"slotted": True}
 
-    cls = builder(cls, gatherer=slot_gatherer, methods=methods, flags={"slotted": True})
+    cls = builder(cls, gatherer=slot_gatherer, methods=methods, flags=flags)
 
     if syntax_check:
         check_argument_order(cls)
@@ -226,6 +226,7 @@ def slotclass(
     /,
     *,
     methods: frozenset[MethodMaker] | set[MethodMaker] = default_methods,
+    flags: None | dict[str, bool] = None,
     syntax_check: bool = True
 ) -> type[_T]: ...
 
@@ -235,6 +236,7 @@ def slotclass(
     /,
     *,
     methods: frozenset[MethodMaker] | set[MethodMaker] = default_methods,
+    flags: None | dict[str, bool] = None,
     syntax_check: bool = True
 ) -> Callable[[type[_T]], type[_T]]: ...
 
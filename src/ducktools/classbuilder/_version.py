@@ -0,0 +1,2 @@
+__version__ = "0.1.dev1+g2e1de1563"
+__version_tuple__ = (0, 1, 'dev1', 'g2e1de1563')
@@ -75,8 +75,20 @@ class _StringGlobs(dict):
 
     It's just a dictionary that returns the key if the key
     is not found.
+
+    Any mappings given as `fallbacks` are searched in order before
+    falling back to the key, this avoids copying large namespaces.
     """
+    def __init__(self, *args, fallbacks=(), **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fallbacks = fallbacks
+
     def __missing__(self, key):
+        for mapping in self.fallbacks:
+            try:
+                return mapping[key]
+            except KeyError:
+                pass
         return _Stringlike(key)
 
     def __repr__(self):
@@ -85,6 +97,26 @@ class _StringGlobs(dict):
         return f"{cls_name}({dict_repr})"
 
 
+# Generated method source and string hints are often identical between
+# classes and compiling is the expensive part, so keep the code objects.
+# The cache is limited in size, dropping the oldest entries first.
+_COMPILE_CACHE_SIZE = 1024
+_compile_cache = {}
+
+
+def _compile_cached(source, mode):
+    key = source, mode
+    try:
+        code = _compile_cache[key]
+    except KeyError:
+        code = compile(source, "<string>", mode)
+        if len(_compile_cache) >= _COMPILE_CACHE_SIZE:
+            # Another thread may have already removed the oldest entry
+            _compile_cache.pop(next(iter(_compile_cache), None), None)
+        _compile_cache[key] = code
+    return code
+
+
 def eval_hint(hint, context=None, *, recursion_limit=2):
     """
     Attempt to evaluate a string type hint in the given
@@ -115,7 +147,11 @@ def eval_hint(hint, context=None, *, recursion_limit=2):
                             returning the original string.
     :return: evaluated hint, or string if it could not evaluate
     """
-    if context is not None:
+    # Nothing to evaluate, don't copy the context
+    if not isinstance(hint, str):
+        return hint
+
+    if context is not None and not isinstance(context, _StringGlobs):
         context = _StringGlobs(context)
 
     original_hint = hint
@@ -129,7 +165,8 @@ def eval_hint(hint, context=None, *, recursion_limit=2):
 
         # noinspection PyBroadException
         try:
-            hint = eval(hint, context)
+            # eval() strips leading spaces and tabs from strings, compile does not
+            hint = eval(_compile_cached(hint.lstrip(" \t"), "eval"), context)
         except Exception:
             break
 
@@ -163,8 +200,10 @@ def call_annotate_func(annotate):
         return raw_annotations
 
     # The annotate func may support forwardref natively
+    # In 3.14 FORWARDREF is format 3, compiler generated functions
+    # raise NotImplementedError for it.
     try:
-        raw_annotations = annotate(2)
+        raw_annotations = annotate(3)
     except NotImplementedError:
         pass
     else:
@@ -172,8 +211,10 @@ def call_annotate_func(annotate):
 
     # Not supported so we have to implement our own deferred handling
     # Some modified logic from annotationlib
-    namespace = {**annotate.__builtins__, **annotate.__globals__}
-    globs = _StringGlobs(namespace)
+    # Look up names in globals then builtins without copying either
+    globs = _StringGlobs(
+        fallbacks=(annotate.__globals__, annotate.__builtins__),
+    )
 
     # This handles closures where the variable is defined after get annotations is called.
     if annotate.__closure__:
@@ -231,7 +272,8 @@ def get_ns_annotations(ns, eval_str=True):
     # Unlike annotationlib we still try to evaluate string annotations
     # This will catch cases where someone has used a literal string for a
     # single attribute.
-    if eval_str:
+    # Building the evaluation context is only needed if there are strings.
+    if eval_str and any(isinstance(v, str) for v in raw_annotations.values()):
         try:
             obj_modulename = ns["__module__"]
         except KeyError:
@@ -251,7 +293,12 @@ def get_ns_annotations(ns, eval_str=True):
             for param in ns.get("__type_params__", ())
         }
 
-        context = {**vars(builtins), **obj_globals, **type_params, **ns}
+        # Look up names in the same order as the merged namespace would
+        # without copying the module globals and builtins
+        context = _StringGlobs(
+            ns,
+            fallbacks=(type_params, obj_globals, vars(builtins)),
+        )
 
         annotations = {
             k: eval_hint(v, context)
@@ -264,30 +311,77 @@ def get_ns_annotations(ns, eval_str=True):
     return annotations
 
 
-def is_classvar(hint):
+# typing objects needed by is_classvar, stored once they are all available
+_typing_lookups = None
+
+
+def _get_typing_lookups():
+    global _typing_lookups
+
     _typing = sys.modules.get("typing")
-    if _typing:
-        # Annotated is a nightmare I'm never waking up from
-        # 3.8 and 3.9 need Annotated from typing_extensions
-        # 3.8 also needs get_origin from typing_extensions
-        if sys.version_info < (3, 10):
-            _typing_extensions = sys.modules.get("typing_extensions")
-            if _typing_extensions:
-                _Annotated = _typing_extensions.Annotated
-                _get_origin = _typing_extensions.get_origin
-            else:
-                _Annotated, _get_origin = None, None
-        else:
-            _Annotated = _typing.Annotated
-            _get_origin = _typing.get_origin
+    if _typing is None:
+        return None
+
+    # Annotated is a nightmare I'm never waking up from
+    # 3.8 and 3.9 need Annotated from typing_extensions
+    # 3.8 also needs get_origin from typing_extensions
+    if sys.version_info < (3, 10):
+        _typing_extensions = sys.modules.get("typing_extensions")
+        if _typing_extensions is None:
+            # Don't store these, typing_extensions may be imported later
+            return _typing.ClassVar, None, None
+        lookups = (
+            _typing.ClassVar,
+            _typing_extensions.Annotated,
+            _typing_extensions.get_origin,
+        )
+    else:
+        lookups = _typing.ClassVar, _typing.Annotated, _typing.get_origin
 
-        if _Annotated and _get_origin(hint) is _Annotated:
-            hint = getattr(hint, "__origin__", None)
+    _typing_lookups = lookups
+    return lookups
+
+
+_CLASSVAR_NAMES = ("ClassVar", "typing.ClassVar")
+_CLASSVAR_PREFIXES = tuple(f"{name}[" for name in _CLASSVAR_NAMES)
+_ANNOTATED_PREFIXES = ("Annotated[", "typing.Annotated[")
+# Inside Annotated[...] a bare ClassVar is followed by the metadata
+_ANNOTATED_CLASSVAR_PREFIXES = (
+    *_CLASSVAR_PREFIXES,
+    *(f"{name}," for name in _CLASSVAR_NAMES),
+)
 
-        if (
-            hint is _typing.ClassVar
-            or getattr(hint, "__origin__", None) is _typing.ClassVar
-        ):
+
+def is_classvar(hint):
+    # String hints are left if they can not be evaluated
+    # Only the bare and 'typing.' qualified names are matched,
+    # other module aliases are not resolved.
+    if isinstance(hint, str):
+        if hint.startswith(_ANNOTATED_PREFIXES):
+            # Check the first argument of Annotated[...]
+            while hint.startswith(_ANNOTATED_PREFIXES):
+                hint = hint.partition("[")[2].lstrip()
+            return hint.startswith(_ANNOTATED_CLASSVAR_PREFIXES)
+        return hint in _CLASSVAR_NAMES or hint.startswith(_CLASSVAR_PREFIXES)
+
+    lookups = _typing_lookups or _get_typing_lookups()
+    if lookups:
+        _ClassVar, _Annotated, _get_origin = lookups
+
+        if hint is _ClassVar:
             return True
+
+        origin = getattr(hint, "__origin__", None)
+        if origin is None:
+            # Plain types are neither ClassVar[...] nor Annotated[...]
+            return False
+
+        if _Annotated and _get_origin(hint) is _Annotated:
+            hint = origin
+            if hint is _ClassVar:
+                return True
+            origin = getattr(hint, "__origin__", None)
+
+        return origin is _ClassVar
     return False
 
@@ -6,6 +6,13 @@ _T = typing.TypeVar("_T")
 _CopiableMappings = dict[str, typing.Any] | types.MappingProxyType[str, typing.Any]
 
 class _StringGlobs(dict):
+    fallbacks: tuple[typing.Mapping[str, typing.Any], ...]
+    def __init__(
+        self,
+        *args,
+        fallbacks: tuple[typing.Mapping[str, typing.Any], ...] = (),
+        **kwargs,
+    ) -> None: ...
     def __missing__(self, key: _T) -> _T: ...
 
 
@@ -28,10 +28,10 @@ Includes pre and post init functions along with other methods.
 from . import (
     INTERNALS_DICT, NOTHING,
     Field, MethodMaker, GatheredFields, GeneratedCode, SlotMakerMeta,
-    builder, get_flags, get_fields,
+    builder, get_fields,
     make_unified_gatherer,
     frozen_setattr_maker, frozen_delattr_maker, eq_maker,
-    get_repr_generator,
+    get_repr_generator, _is_literal,
 )
 
 # These aren't used but are re-exported for ease of use
@@ -59,15 +59,46 @@ def get_attributes(cls):
     return getattr(cls, INTERNALS_DICT)["fields"]
 
 
+def _get_extra_func_args(cls, funcname):
+    """
+    Get the arguments of a pre or post init function.
+
+    :param cls: prefab class
+    :param funcname: PRE_INIT_FUNC or POST_INIT_FUNC
+    :return: (function, argument names) or None if the function is not defined
+    """
+    try:
+        func = getattr(cls, funcname)
+        func_code = func.__code__
+    except AttributeError:
+        return None
+
+    # Include the first argument if the method is static
+    skip = 0 if type(cls.__dict__.get(funcname)) is staticmethod else 1
+
+    argcount = func_code.co_argcount + func_code.co_kwonlyargcount
+    arglist = func_code.co_varnames[skip:argcount]
+
+    return func, arglist
+
+
 # Method Generators
 def init_generator(cls, funcname="__init__"):
     globs = {}
     # Get the internals dictionary and prepare attributes
-    attributes = get_attributes(cls)
-    flags = get_flags(cls)
+    internals = getattr(cls, INTERNALS_DICT)
+    attributes = internals["fields"]
+    flags = internals["flags"]
 
     kw_only = flags.get("kw_only", False)
 
+    # Frozen classes block `__setattr__` so set the initial values directly
+    if flags.get("frozen", False):
+        globs["__setattr_func"] = object.__setattr__
+        assignment_template = "    __setattr_func(self, {name!r}, {value})"
+    else:
+        assignment_template = "    self.{name} = {value}"
+
     # Handle pre/post init first - post_init can change types for __init__
     # Get pre and post init arguments
     pre_init_args = []
@@ -78,23 +109,9 @@ def init_generator(cls, funcname="__init__"):
         (PRE_INIT_FUNC, pre_init_args),
         (POST_INIT_FUNC, post_init_args),
     ]:
-        try:
-            func = getattr(cls, extra_funcname)
-            func_code = func.__code__
-        except AttributeError:
-            pass
-        else:
-            argcount = func_code.co_argcount + func_code.co_kwonlyargcount
-
-            # Identify if method is static, if so include first arg, otherwise skip
-            is_static = type(cls.__dict__.get(extra_funcname)) is staticmethod
-
-            arglist = (
-                func_code.co_varnames[:argcount]
-                if is_static
-                else func_code.co_varnames[1:argcount]
-            )
-
+        extra_args = _get_extra_func_args(cls, extra_funcname)
+        if extra_args is not None:
+            func, arglist = extra_args
             func_arglist.extend(arglist)
 
             if extra_funcname == POST_INIT_FUNC:
@@ -102,16 +119,17 @@ def init_generator(cls, funcname="__init__"):
 
     pos_arglist = []
     kw_only_arglist = []
+    assignments = []
+    processes = []  # post_init values still need default factories to be called.
     for name, attrib in attributes.items():
-        # post_init annotations can be used to broaden types.
-        if name in post_init_annotations:
-            globs[f"_{name}_type"] = post_init_annotations[name]
-        elif attrib.type is not NOTHING:
-            globs[f"_{name}_type"] = attrib.type
-
         if attrib.init:
+            # Types are only needed for annotated arguments
+            # post_init annotations can be used to broaden types.
+            if attrib.type is not NOTHING:
+                globs[f"_{name}_type"] = post_init_annotations.get(name, attrib.type)
+
             if attrib.default is not NOTHING:
-                if isinstance(attrib.default, (str, int, float, bool)):
+                if _is_literal(attrib.default):
                     # Just use the literal in these cases
                     if attrib.type is NOTHING:
                         arg = f"{name}={attrib.default!r}"
@@ -126,6 +144,7 @@ def init_generator(cls, funcname="__init__"):
                     else:
                         arg = f"{name}: _{name}_type = _{name}_default"
                     globs[f"_{name}_default"] = attrib.default
+                value = name
             elif attrib.default_factory is not NOTHING:
                 # Use NONE here and call the factory later
                 # This matches the behaviour of compiled
@@ -134,11 +153,13 @@ def init_generator(cls, funcname="__init__"):
                 else:
                     arg = f"{name}: _{name}_type = None"
                 globs[f"_{name}_factory"] = attrib.default_factory
+                value = f"{name} if {name} is not None else _{name}_factory()"
             else:
                 if attrib.type is NOTHING:
                     arg = name
                 else:
                     arg = f"{name}: _{name}_type"
+                value = name
             if attrib.kw_only or kw_only:
                 kw_only_arglist.append(arg)
             else:
@@ -147,8 +168,18 @@ def init_generator(cls, funcname="__init__"):
         else:
             if attrib.default is not NOTHING:
                 globs[f"_{name}_default"] = attrib.default
+                value = f"_{name}_default"
             elif attrib.default_factory is not NOTHING:
                 globs[f"_{name}_factory"] = attrib.default_factory
+                value = f"_{name}_factory()"
+            else:
+                value = None
+
+        if name in post_init_args:
+            if attrib.default_factory is not NOTHING:
+                processes.append(f"    {name} = {value}")
+        elif value is not None:
+            assignments.append(assignment_template.format(name=name, value=value))
 
     pos_args = ", ".join(pos_arglist)
     kw_args = ", ".join(kw_only_arglist)
@@ -159,28 +190,6 @@ def init_generator(cls, funcname="__init__"):
     else:
         args = pos_args
 
-    assignments = []
-    processes = []  # post_init values still need default factories to be called.
-    for name, attrib in attributes.items():
-        if attrib.init:
-            if attrib.default_factory is not NOTHING:
-                value = f"{name} if {name} is not None else _{name}_factory()"
-            else:
-                value = name
-        else:
-            if attrib.default_factory is not NOTHING:
-                value = f"_{name}_factory()"
-            elif attrib.default is not NOTHING:
-                value = f"_{name}_default"
-            else:
-                value = None
-
-        if name in post_init_args:
-            if attrib.default_factory is not NOTHING:
-                processes.append((name, value))
-        elif value is not None:
-            assignments.append((name, value))
-
     if hasattr(cls, PRE_INIT_FUNC):
         pre_init_arg_call = ", ".join(f"{name}={name}" for name in pre_init_args)
         pre_init_call = f"    self.{PRE_INIT_FUNC}({pre_init_arg_call})\n"
@@ -188,12 +197,7 @@ def init_generator(cls, funcname="__init__"):
         pre_init_call = ""
 
     if assignments or processes:
-        body = ""
-        body += "\n".join(
-            f"    self.{name} = {value}" for name, value in assignments
-        )
-        body += "\n"
-        body += "\n".join(f"    {name} = {value}" for name, value in processes)
+        body = "\n".join(assignments + processes)
     else:
         body = "    pass"
 
@@ -439,6 +443,7 @@ def _make_prefab(
     flags = {
         "kw_only": kw_only,
         "slotted": slotted,
+        "frozen": frozen,
     }
 
     cls = builder(
@@ -452,65 +457,24 @@ def _make_prefab(
     fields = get_fields(cls)
 
     # Check pre_init and post_init functions if they exist
-    try:
-        func = getattr(cls, PRE_INIT_FUNC)
-        func_code = func.__code__
-    except AttributeError:
-        pass
-    else:
-        if func_code.co_posonlyargcount > 0:
-            raise PrefabError(
-                "Positional only arguments are not supported in pre or post init functions."
-            )
-
-        argcount = func_code.co_argcount + func_code.co_kwonlyargcount
-
-        # Include the first argument if the method is static
-        is_static = type(cls.__dict__.get(PRE_INIT_FUNC)) is staticmethod
-
-        arglist = (
-            func_code.co_varnames[:argcount]
-            if is_static
-            else func_code.co_varnames[1:argcount]
-        )
+    for extra_funcname in (PRE_INIT_FUNC, POST_INIT_FUNC):
+        extra_args = _get_extra_func_args(cls, extra_funcname)
+        if extra_args is None:
+            continue
 
-        for item in arglist:
-            if item not in fields.keys():
-                raise PrefabError(
-                    f"{item} argument in {PRE_INIT_FUNC} is not a valid attribute."
-                )
+        func, arglist = extra_args
 
-    post_init_args = []
-    try:
-        func = getattr(cls, POST_INIT_FUNC)
-        func_code = func.__code__
-    except AttributeError:
-        pass
-    else:
-        if func_code.co_posonlyargcount > 0:
+        if func.__code__.co_posonlyargcount > 0:
             raise PrefabError(
                 "Positional only arguments are not supported in pre or post init functions."
             )
 
-        argcount = func_code.co_argcount + func_code.co_kwonlyargcount
-
-        # Include the first argument if the method is static
-        is_static = type(cls.__dict__.get(POST_INIT_FUNC)) is staticmethod
-
-        arglist = (
-            func_code.co_varnames[:argcount]
-            if is_static
-            else func_code.co_varnames[1:argcount]
-        )
-
         for item in arglist:
-            if item not in fields.keys():
+            if item not in fields:
                 raise PrefabError(
-                    f"{item} argument in {POST_INIT_FUNC} is not a valid attribute."
+                    f"{item} argument in {extra_funcname} is not a valid attribute."
                 )
 
-        post_init_args.extend(arglist)
-
     # Gather values for match_args and do some syntax checking
     default_defined = []
     valid_args = list(fields.keys())
@@ -66,6 +66,19 @@ def test_annotation_gatherer():
     assert modifications["c"] is NOTHING
 
 
+def test_annotation_gatherer_unevaluated_classvar():
+    # String hints that can't be evaluated are recognised the same
+    # way whether or not ClassVar is wrapped in Annotated
+    class ExampleUnevaluated:
+        a: "ClassVar[Undefined]" = "a"  # noqa
+        b: "Annotated[ClassVar[Undefined], '']" = "b"  # noqa
+        c: "Annotated[Undefined, '']" = "c"  # noqa
+
+    annos, modifications = annotation_gatherer(ExampleUnevaluated)
+
+    assert list(annos) == ["c"]
+
+
 def test_make_annotation_gatherer():
     class NewField(Field):
         __slots__ = SlotFields(newval=False)
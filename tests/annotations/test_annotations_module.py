@@ -1,7 +1,11 @@
 import builtins
+import sys
+
+import pytest
 
 from ducktools.classbuilder.annotations import (
     _StringGlobs,
+    call_annotate_func,
     eval_hint,
     get_ns_annotations,
     is_classvar,
@@ -18,6 +22,70 @@ def test_string_globs():
     assert repr(context) == f"_StringGlobs({{'str': {str!r}}})"
 
 
+def test_compile_cache_limit(monkeypatch):
+    from ducktools.classbuilder import annotations
+
+    monkeypatch.setattr(annotations, "_COMPILE_CACHE_SIZE", 2)
+    monkeypatch.setattr(annotations, "_compile_cache", {})
+
+    annotations._compile_cached("int", "eval")
+    annotations._compile_cached("str", "eval")
+    annotations._compile_cached("str", "eval")
+    annotations._compile_cached("str", "exec")
+
+    # Oldest entry is removed first, modes are cached separately
+    assert list(annotations._compile_cache) == [("str", "eval"), ("str", "exec")]
+
+
+def test_compile_cache_threaded(monkeypatch):
+    import threading
+    from ducktools.classbuilder import annotations
+
+    barrier = threading.Barrier(2)
+
+    class SyncedDict(dict):
+        # Make both threads pick the same oldest entry before either removes it
+        def __iter__(self):
+            keys = list(dict.__iter__(self))
+            barrier.wait(timeout=5)
+            return iter(keys)
+
+    monkeypatch.setattr(annotations, "_COMPILE_CACHE_SIZE", 1)
+    monkeypatch.setattr(annotations, "_compile_cache", SyncedDict())
+    annotations._compile_cached("int", "eval")
+
+    errors = []
+
+    def worker(source):
+        try:
+            annotations._compile_cached(source, "eval")
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(s,)) for s in ("str", "float")]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    assert ("int", "eval") not in annotations._compile_cache
+
+
+def test_string_globs_fallbacks():
+    context = _StringGlobs(
+        {'str': str},
+        fallbacks=({'str': int, 'List': List}, vars(builtins)),
+    )
+    assert context['str'] == str  # own values first
+    assert context['List'] == List
+    assert context['int'] == int
+    assert context['forwardref'] == 'forwardref'
+
+    # An existing _StringGlobs is used as is
+    assert eval_hint("List[forwardref]", context) == List["forwardref"]
+
+
 class TestEvalHint:
     def test_basic(self):
         assert eval_hint('str') == str
@@ -53,6 +121,12 @@ class TestEvalHint:
         assert eval_hint("alt_str", context) == str
         assert eval_hint("bleh", context) == "bleh"
 
+    def test_leading_whitespace(self):
+        # Matches eval() on a string which ignores leading spaces and tabs
+        context = _StringGlobs(fallbacks=(vars(builtins),))
+        assert eval_hint(" int", context) == int
+        assert eval_hint("\tstr", context) == str
+
     def test_evil_hint(self):
         # Nobody should evaluate anything that does this, but it shouldn't break
         # On every evaluation this function generates a new string
@@ -106,6 +180,21 @@ def test_ns_annotations():
     }
 
 
+def test_ns_annotations_no_strings():
+    class NoStrings:
+        a: str
+        b: List[str]
+
+    raw = NoStrings.__dict__.get("__annotations__")
+    annos = get_ns_annotations(vars(NoStrings))
+
+    assert annos == {"a": str, "b": List[str]}
+
+    # Still a copy even if nothing needed evaluating
+    if raw is not None:
+        assert annos is not raw
+
+
 def test_is_classvar():
     assert is_classvar(ClassVar)
     assert is_classvar(ClassVar[str])
@@ -116,3 +205,70 @@ def test_is_classvar():
 
     assert not is_classvar(str)
     assert not is_classvar(Annotated[str, ''])
+
+    # Strings that could not be evaluated
+    assert is_classvar("ClassVar")
+    assert is_classvar("ClassVar[Undefined.attr]")
+    assert is_classvar("typing.ClassVar[int]")
+
+    assert is_classvar("Annotated[ClassVar[Undefined], '']")
+    assert is_classvar("typing.Annotated[ClassVar, '']")
+    assert is_classvar("Annotated[Annotated[ClassVar[int], ''], '']")
+
+    assert not is_classvar("str")
+    assert not is_classvar("ClassVariable")
+    assert not is_classvar("list[ClassVar[int]]")
+    assert not is_classvar("Annotated[str, 'ClassVar[int]']")
+    assert not is_classvar("Annotated[ClassVariable, '']")
+    # Other module aliases are not resolved
+    assert not is_classvar("t.ClassVar[int]")
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="Needs function __builtins__")
+def test_call_annotate_func_fallback():
+    # Emulate an __annotate__ function that only supports VALUE
+    def make_annotate():
+        def annotate(format):
+            if format != 1:
+                raise NotImplementedError
+            return {"a": List[undefined], "b": int, "c": later}  # noqa
+        later = float
+        return annotate
+
+    annos = call_annotate_func(make_annotate())
+
+    assert annos == {"a": List["undefined"], "b": int, "c": float}
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="Needs function __builtins__")
+def test_call_annotate_func_fake_globals_format():
+    # Compiler generated __annotate__ functions in 3.14 accept
+    # VALUE (1) and VALUE_WITH_FAKE_GLOBALS (2)
+    # VALUE_WITH_FAKE_GLOBALS should not be called with the real globals
+    formats = []
+
+    def annotate(format):
+        formats.append(format)
+        if format > 2:
+            raise NotImplementedError
+        return {"a": undefined, "b": int}  # noqa
+
+    annos = call_annotate_func(annotate)
+
+    assert annos == {"a": "undefined", "b": int}
+    assert 2 not in formats
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="Needs function __builtins__")
+def test_call_annotate_func_forwardref_format():
+    # Handwritten __annotate__ functions may support FORWARDREF (3) directly
+    def annotate(format):
+        if format == 3:
+            return {"a": "forwardref_result", "b": int}
+        elif format == 1:
+            return {"a": undefined, "b": int}  # noqa
+        raise NotImplementedError
+
+    annos = call_annotate_func(annotate)
+
+    assert annos == {"a": "forwardref_result", "b": int}
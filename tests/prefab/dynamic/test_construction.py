@@ -114,3 +114,21 @@ def test_build_slotted():
     # Test slots are functioning
     with pytest.raises(AttributeError):
         inst.z = 0
+
+
+def test_non_literal_defaults():
+    from enum import IntEnum
+
+    class Colour(IntEnum):
+        RED = 1
+
+    @prefab
+    class Defaults:
+        colour: Colour = Colour.RED
+        limit: float = float("inf")
+        point: tuple = (1.5, "a", None)
+
+    inst = Defaults()
+    assert inst.colour is Colour.RED
+    assert inst.limit == float("inf")
+    assert inst.point == (1.5, "a", None)
@@ -96,3 +96,19 @@ def test_hash_keys():
     assert ex_dict[ex_copy] is ex
     assert ex_different_x not in ex_dict
     assert ex_different_y not in ex_dict
+
+
+def test_frozen_private_factory():
+    # Private fields are not __init__ arguments but are still set
+    # by the frozen __init__ from their default factory
+    @prefab(frozen=True)
+    class FrozenPrivate:
+        x: int = 1
+        y: list = attribute(default_factory=list, private=True)
+
+    ex = FrozenPrivate(x=2)
+    assert ex.x == 2
+    assert ex.y == []
+
+    with pytest.raises(TypeError):
+        ex.y = [1]
@@ -55,3 +55,41 @@ def test_post_init_not_self():
 
     with pytest.raises(ValueError):
         ex = PostInitNotSelf(2, 1)
+
+
+def test_pre_post_init_positional_and_kw_only():
+    @prefab
+    class PrePostMixed:
+        x: int = 1
+        y: int = 2
+
+        def __prefab_pre_init__(self, x, *, y):
+            self.pre_values = (x, y)
+
+        def __prefab_post_init__(self, x, *, y):
+            self.x = x
+            self.y = y * 2
+
+    ex = PrePostMixed(3, 4)
+    assert ex.pre_values == (3, 4)
+    assert (ex.x, ex.y) == (3, 8)
+
+
+def test_post_init_overridden_argument_order():
+    # Undecorated subclasses inherit __init__ but may reorder the arguments
+    @prefab
+    class Base:
+        a: int
+        b: int
+
+        def __prefab_post_init__(self, a, b):
+            self.a = a
+            self.b = b
+
+    class Reordered(Base):
+        def __prefab_post_init__(self, b, a):
+            self.a = a
+            self.b = b
+
+    ex = Reordered(1, 2)
+    assert (ex.a, ex.b) == (1, 2)
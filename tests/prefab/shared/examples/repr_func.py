@@ -43,3 +43,13 @@ class RegularReprOneArg:
 @prefab(recursive_repr=True)
 class RecursiveObject:
     x: "RecursiveObject | None" = None
+
+
+@prefab(recursive_repr=True)
+class RecursiveOuter:
+    inner: "RecursiveInner | None" = None
+
+
+@prefab(recursive_repr=True)
+class RecursiveInner:
+    outer: "RecursiveOuter | None" = None
@@ -47,3 +47,14 @@ def test_recursive():
     ex.x = ex
 
     assert repr(ex) == "RecursiveObject(x=...)"
+
+
+def test_recursive_mutual():
+    from repr_func import RecursiveOuter, RecursiveInner
+
+    outer = RecursiveOuter()
+    inner = RecursiveInner(outer)
+    outer.inner = inner
+
+    assert repr(outer) == "RecursiveOuter(inner=RecursiveInner(outer=...))"
+    assert repr(inner) == "RecursiveInner(outer=RecursiveOuter(inner=...))"
@@ -80,6 +80,108 @@ def test_method_maker():
     assert ValueX.__dict__["demo"] != method_desc
 
 
+def test_method_maker_shared_code():
+    # Classes with the same fields should reuse the compiled code
+    @slotclass
+    class First:
+        __slots__ = SlotFields(a=1, b=2)
+
+    @slotclass
+    class Second:
+        __slots__ = SlotFields(a=3, b=4)
+
+    assert First.__init__.__code__ is Second.__init__.__code__
+    assert First.__repr__.__code__ is Second.__repr__.__code__
+
+    # Globals are still specific to each class
+    assert First() == First(1, 2)
+    assert Second() == Second(3, 4)
+    assert repr(First()).endswith("First(a=1, b=2)")
+    assert repr(Second()).endswith("Second(a=3, b=4)")
+
+
+def test_method_maker_threaded():
+    import threading
+    import time
+
+    calls = []
+
+    def generator(cls, funcname="demo"):
+        calls.append(cls)
+        time.sleep(0.01)  # Give other threads a chance to reach the lock
+        return GeneratedCode(f"def {funcname}(self): return 42\n", {})
+
+    demo_maker = MethodMaker("demo", generator)
+
+    class Demo:
+        demo = demo_maker
+
+    barrier = threading.Barrier(4)
+    results = []
+
+    def worker():
+        barrier.wait()
+        results.append(Demo().demo())
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert results == [42] * 4
+    assert calls == [Demo]
+
+
+def test_noinit_literal_defaults():
+    import enum
+
+    class Colour(enum.IntEnum):
+        RED = 1
+
+    @slotclass
+    class NoInit:
+        __slots__ = SlotFields(
+            a=Field(default=1, init=False),
+            b=Field(default=(1.5, "b", None), init=False),
+            c=Field(default=float("nan"), init=False),
+            d=Field(default=Colour.RED, init=False),
+        )
+
+    ex = NoInit()
+    assert ex.a == 1
+    assert ex.b == (1.5, "b", None)
+    assert ex.c != ex.c  # nan
+    assert ex.d is Colour.RED
+
+    # Only values that can't be written as literals need to be in globals
+    assert NoInit.__init__.__globals__.keys() >= {"_c_default", "_d_default"}
+    assert "_a_default" not in NoInit.__init__.__globals__
+    assert "_b_default" not in NoInit.__init__.__globals__
+
+
+def test_builder_unbuilt_intermediate():
+    # A subclass that was not built should not bring
+    # its parent's fields back in a later position in the MRO
+    @slotclass
+    class A:
+        __slots__ = SlotFields(f=1)
+
+    @slotclass
+    class B(A):
+        __slots__ = SlotFields(f=2)
+
+    class C(A):
+        __slots__ = ()
+
+    @slotclass
+    class D(C, B):
+        __slots__ = SlotFields()
+
+    assert get_fields(D)["f"].default == 2
+    assert D().f == 2
+
+
 def test_construct_field():
     f = Field()
     assert f.default is NOTHING
@@ -192,6 +294,43 @@ def test_frozen_unslotted():
         ex.b = "goodbye"
 
 
+@pytest.mark.parametrize("slotted", [True, False])
+def test_frozen_init_skips_setattr(slotted):
+    # The 'frozen' flag makes __init__ use object.__setattr__ directly
+    methods = default_methods | {frozen_setattr_maker, frozen_delattr_maker}
+
+    if slotted:
+        class Ex:
+            __slots__ = SlotFields(a=41, b=Field(default_factory=list))
+
+        Ex = slotclass(Ex, methods=methods, flags={"frozen": True})
+        assert get_flags(Ex) == {"frozen": True, "slotted": True}
+    else:
+        class Ex:
+            a: int = 41
+            b: list = Field(default_factory=list)
+
+        Ex = builder(Ex, gatherer=make_unified_gatherer(Field), methods=methods,
+                     flags={"frozen": True, "slotted": False})
+
+    class CountingSetattr(Ex):
+        __slots__ = ()
+        setattr_calls = 0
+
+        def __setattr__(self, name, value):
+            type(self).setattr_calls += 1
+            super().__setattr__(name, value)
+
+    ex = CountingSetattr(a=42)
+    assert ex.a == 42
+    assert ex.b == []
+    assert CountingSetattr.setattr_calls == 0
+
+    with pytest.raises(TypeError):
+        ex.a = 43
+    assert CountingSetattr.setattr_calls == 1
+
+
 def test_slot_gatherer_success():
 
     fields = {